@@ -20,12 +20,11 @@ Uso:
 
 from __future__ import annotations
 
-import csv
+import multiprocessing
 import os
 import random
 import sys
-import uuid as uuidlib
-from datetime import datetime, timedelta
+from datetime import date, datetime
 
 # Tentativa opcional de usar Faker (se existir).
 _FAKE = None
@@ -92,46 +91,21 @@ COMPANIES   = ["InovaTech", "Alpha Sistemas", "Data+Brasil", "Azul Digital", "Te
 JOBS        = ["Analista de Sistemas", "Engenheiro de Software", "Suporte Técnico", "Cientista de Dados", "DevOps"]
 DOMAINS     = ["exemplo.com", "empresa.com.br", "corp.br", "mail.com"]
 
-def rand_first_name():
-    if _FAKE:
-        return _FAKE.first_name()
-    return random.choice(FIRST_NAMES)
+# Tipos categóricos sorteados direto destas listas quando não há Faker
+CATEGORY_POOLS = {
+    "first_name": FIRST_NAMES,
+    "last_name": LAST_NAMES,
+    "city": CITIES,
+    "state": STATES,
+    "company": COMPANIES,
+    "job": JOBS,
+}
 
 def rand_last_name():
     if _FAKE:
         return _FAKE.last_name()
     return random.choice(LAST_NAMES)
 
-def rand_full_name():
-    if _FAKE:
-        return _FAKE.name()
-    return f"{rand_first_name()} {rand_last_name()}"
-
-def rand_email():
-    if _FAKE:
-        return _FAKE.free_email()
-    fn = rand_first_name().lower()
-    ln = rand_last_name().lower()
-    dom = random.choice(DOMAINS)
-    return f"{fn}.{ln}@{dom}"
-
-def rand_phone():
-    # Formato brasileiro típico: (DD) 9XXXX-XXXX
-    ddd = random.randint(11, 99)
-    prefixo = random.randint(90000, 99999)
-    sufixo = random.randint(0000, 9999)
-    return f"({ddd}) {prefixo:05d}-{sufixo:04d}"
-
-def rand_company():
-    if _FAKE:
-        return _FAKE.company()
-    return random.choice(COMPANIES)
-
-def rand_job():
-    if _FAKE:
-        return _FAKE.job()
-    return random.choice(JOBS)
-
 def rand_city():
     if _FAKE:
         return _FAKE.city()
@@ -150,83 +124,115 @@ def rand_address():
     num = random.randint(1, 9999)
     return f"Rua {rand_last_name()}, {num}, {rand_city()} - {rand_state()}"
 
-def rand_cep(formatado=True):
-    # CEP: 8 dígitos; formato comum 00000-000
-    d = [random.randint(0,9) for _ in range(8)]
-    if formatado:
-        return f"{d[0]}{d[1]}{d[2]}{d[3]}{d[4]}-{d[5]}{d[6]}{d[7]}"
-    return "".join(str(x) for x in d)
-
 # --------------------- Geradores numéricos ---------------------
 
-def rand_int(min_val: int = 0, max_val: int = 100) -> int:
-    return random.randint(min_val, max_val)
+# UUID v4 montado direto dos bytes aleatórios, sem criar objetos uuid.UUID.
+# As tabelas ajustam os bits de versão (4) e de variante (RFC 4122) via bytes.translate.
+_UUID_VERSAO = bytes((b & 0x0F) | 0x40 for b in range(256))
+_UUID_VARIANTE = bytes((b & 0x3F) | 0x80 for b in range(256))
 
-def rand_float(min_val: float = 0.0, max_val: float = 100.0, decimals: int = 2) -> float:
+def batch_uuid(n: int) -> list[str]:
+    raw = bytearray(os.urandom(16 * n))
+    raw[6::16] = raw[6::16].translate(_UUID_VERSAO)
+    raw[8::16] = raw[8::16].translate(_UUID_VARIANTE)
+    h = raw.hex()
+    return [f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+            for i in range(0, 32 * n, 32)]
+
+# Versões em lote: geram n valores (já como texto) de uma vez, sem uma chamada por linha
+
+def batch_int(n: int, min_val: int = 0, max_val: int = 100) -> list[str]:
+    if max_val - min_val >= 1 << 32:
+        # random.choices usa random() * tamanho; em faixas enormes, randint é exato
+        return [str(random.randint(min_val, max_val)) for _ in range(n)]
+    return list(map(str, random.choices(range(min_val, max_val + 1), k=n)))
+
+def batch_float(n: int, min_val: float = 0.0, max_val: float = 100.0, decimals: int = 2) -> list[str]:
     if min_val > max_val:
         min_val, max_val = max_val, min_val
-    val = random.random() * (max_val - min_val) + min_val
-    return round(val, decimals)
+    span = max_val - min_val
+    rnd = random.random
+    fmt = f"%.{decimals}f"  # a formatação já arredonda; dispensa o round()
+    return [fmt % (rnd() * span + min_val) for _ in range(n)]
+
+_BOOL_TXT = {"0": "false", "1": "true"}
+
+def batch_bool(n: int) -> list[str]:
+    # Um único getrandbits(n) fornece os n sorteios (um bit por linha)
+    return list(map(_BOOL_TXT.__getitem__, format(random.getrandbits(n), f"0{n}b")))
+
+# Tabelas de texto pré-formatado: o lote vira um random.choices sobre strings prontas
+TABLE_MAX = 1 << 16      # maior tabela montada por coluna (valores distintos)
+TABLE_BUDGET = 1 << 19   # total de entradas somando todas as tabelas (limita a memória)
+_TABELAS: dict = {}      # tabelas já montadas, compartilhadas por colunas de mesma faixa
+
+def _tabela(chave: tuple, tamanho: int, montar):
+    # Devolve a tabela da chave, montando-a se couber nos limites; None = sem tabela
+    tab = _TABELAS.get(chave)
+    if tab is None and tamanho <= TABLE_MAX and sum(map(len, _TABELAS.values())) + tamanho <= TABLE_BUDGET:
+        tab = _TABELAS[chave] = montar()
+    return tab
+
+_QUATRO_DIGITOS = [f"{i:04d}" for i in range(10000)]
+_DDD_TXT = [f"({ddd}) 9" for ddd in range(11, 100)]
 
-def rand_bool() -> bool:
-    return random.choice([True, False])
+def batch_phone(n: int) -> list[str]:
+    q = _QUATRO_DIGITOS
+    return [f"{ddd}{p}-{s}" for ddd, p, s in zip(random.choices(_DDD_TXT, k=n), random.choices(q, k=n), random.choices(q, k=n))]
 
-def rand_uuid() -> str:
-    return str(uuidlib.uuid4())
+def batch_cep(n: int, formatado: bool = True) -> list[str]:
+    sep = "-" if formatado else ""
+    return [f"{a:05d}{sep}{b:03d}" for a, b in zip(random.choices(range(100000), k=n), random.choices(range(1000), k=n))]
 
 # --------------------- Datas e Horários ------------------------
 
-def rand_date(year_start: int = 2010, year_end: int = datetime.now().year) -> str:
-    y = random.randint(year_start, year_end)
-    # garantir meses/dias válidos de forma simples
-    start = datetime(y, 1, 1)
-    end = datetime(y, 12, 31)
-    delta = end - start
-    rd = start + timedelta(days=random.randint(0, delta.days))
-    return rd.strftime("%Y-%m-%d")
-
-def rand_datetime(year_start: int = 2010, year_end: int = datetime.now().year) -> str:
-    y = random.randint(year_start, year_end)
-    start = datetime(y, 1, 1, 0, 0, 0)
-    end = datetime(y, 12, 31, 23, 59, 59)
-    total_seconds = int((end - start).total_seconds())
-    offset = random.randint(0, total_seconds)
-    dt = start + timedelta(seconds=offset)
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+_CURRENT_YEAR = datetime.now().year  # ano corrente, lido uma vez na carga do módulo
 
 # --------------------- CPF (com dígitos) -----------------------
 
-def _cpf_dv(digs: list[int]) -> int:
-    # Calcula dígito verificador (módulo 11)
-    peso = list(range(len(digs) + 1, 1, -1))
-    soma = sum(d * p for d, p in zip(digs, peso))
-    resto = soma % 11
-    return 0 if resto < 2 else 11 - resto
-
-def rand_cpf(formatado: bool = True) -> str:
-    base = [random.randint(0, 9) for _ in range(9)]
-    dv1 = _cpf_dv(base)
-    dv2 = _cpf_dv(base + [dv1])
-    nums = base + [dv1, dv2]
-    if formatado:
-        return f"{nums[0]}{nums[1]}{nums[2]}.{nums[3]}{nums[4]}{nums[5]}.{nums[6]}{nums[7]}{nums[8]}-{nums[9]}{nums[10]}"
-    return "".join(str(n) for n in nums)
+# Para o lote, a base do CPF é sorteada em 3 grupos de 3 dígitos (0..999) e as
+# somas ponderadas de cada grupo vêm de tabelas pré-calculadas.
+def _cpf_tabela(pesos: tuple[int, int, int]) -> list[int]:
+    return [sum(int(d) * p for d, p in zip(f"{i:03d}", pesos)) for i in range(1000)]
+
+_CPF_SOMA1 = [_cpf_tabela(p) for p in ((10, 9, 8), (7, 6, 5), (4, 3, 2))]
+_CPF_SOMA2 = [_cpf_tabela(p) for p in ((11, 10, 9), (8, 7, 6), (5, 4, 3))]
+_CPF_DV = [0 if resto < 2 else 11 - resto for resto in range(11)]  # indexado por soma % 11
+_TRES_DIGITOS = [f"{i:03d}" for i in range(1000)]
+
+def batch_cpf(n: int, formatado: bool = True) -> list[str]:
+    (s1a, s1b, s1c), (s2a, s2b, s2c) = _CPF_SOMA1, _CPF_SOMA2
+    dv, txt = _CPF_DV, _TRES_DIGITOS
+    ponto, traco = (".", "-") if formatado else ("", "")
+    grupos = range(1000)
+    out = []
+    for a, b, c in zip(random.choices(grupos, k=n), random.choices(grupos, k=n), random.choices(grupos, k=n)):
+        dv1 = dv[(s1a[a] + s1b[b] + s1c[c]) % 11]
+        dv2 = dv[(s2a[a] + s2b[b] + s2c[c] + 2 * dv1) % 11]
+        out.append(f"{txt[a]}{ponto}{txt[b]}{ponto}{txt[c]}{traco}{dv1}{dv2}")
+    return out
 
 # --------------------- Texto / URL -----------------------------
 
-LOREM_WORDS = (
+LOREM_WORDS = tuple((
     "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore "
     "et dolore magna aliqua ut enim ad minim veniam quis nostrud exercitation ullamco laboris nisi ut aliquip "
     "ex ea commodo consequat duis aute irure dolor in reprehenderit in voluptate velit esse cillum dolore eu "
     "fugiat nulla pariatur excepteur sint occaecat cupidatat non proident sunt in culpa qui officia deserunt "
     "mollit anim id est laborum"
-).split()
-
-def rand_sentence(min_words: int = 4, max_words: int = 12) -> str:
-    n = random.randint(min_words, max_words)
-    words = random.choices(LOREM_WORDS, k=n)
-    s = " ".join(words)
-    return s.capitalize() + "."
+).split())
+
+def batch_sentence(n: int, min_words: int = 4, max_words: int = 12) -> list[str]:
+    # Tamanhos e palavras do lote inteiro saem de dois random.choices; depois é só fatiar
+    sizes = random.choices(range(min_words, max_words + 1), k=n)
+    words = random.choices(LOREM_WORDS, k=sum(sizes))
+    out = []
+    i = 0
+    for size in sizes:
+        s = " ".join(words[i:i + size])
+        i += size
+        out.append(s[:1].upper() + s[1:] + ".")  # as palavras já são minúsculas
+    return out
 
 def rand_url():
     if _FAKE:
@@ -293,12 +299,12 @@ def get_column_config(col_type_code: str) -> dict:
             cfg["min"], cfg["max"] = cfg["max"], cfg["min"]
     elif col_type_code == "date":
         cfg["year_start"] = prompt_int("  - Ano inicial (ex.: 2015)", default=2015)
-        cfg["year_end"]   = prompt_int("  - Ano final (ex.: 2025)", default=datetime.now().year)
+        cfg["year_end"]   = prompt_int("  - Ano final (ex.: 2025)", default=_CURRENT_YEAR)
         if cfg["year_start"] > cfg["year_end"]:
             cfg["year_start"], cfg["year_end"] = cfg["year_end"], cfg["year_start"]
     elif col_type_code == "datetime":
         cfg["year_start"] = prompt_int("  - Ano inicial (ex.: 2015)", default=2015)
-        cfg["year_end"]   = prompt_int("  - Ano final (ex.: 2025)", default=datetime.now().year)
+        cfg["year_end"]   = prompt_int("  - Ano final (ex.: 2025)", default=_CURRENT_YEAR)
         if cfg["year_start"] > cfg["year_end"]:
             cfg["year_start"], cfg["year_end"] = cfg["year_end"], cfg["year_start"]
     elif col_type_code == "picklist":
@@ -313,59 +319,220 @@ def get_column_config(col_type_code: str) -> dict:
     return cfg
 
 def build_generator(col_type_code: str, cfg: dict):
-    # Retorna uma função sem argumentos que gera o valor (string)
-    if col_type_code == "full_name":
-        return lambda: rand_full_name()
-    if col_type_code == "first_name":
-        return lambda: rand_first_name()
-    if col_type_code == "last_name":
-        return lambda: rand_last_name()
-    if col_type_code == "email":
-        return lambda: rand_email()
-    if col_type_code == "phone":
-        return lambda: rand_phone()
-    if col_type_code == "cpf":
-        return lambda: rand_cpf(formatado=True)
+    # Retorna uma função sem argumentos que gera o valor (string). Cada tipo tem uma
+    # única implementação, a de build_batch_generator; aqui é só um lote de 1.
+    batch = build_batch_generator(col_type_code, cfg)
+    return lambda: batch(1)[0]
+
+def _value_generator(col_type_code: str):
+    # Geradores de valor único dos tipos sem versão em lote (Faker, endereço, URL).
+    # Retorna None para códigos desconhecidos.
+    if _FAKE:
+        # Com Faker, o método já fica resolvido aqui (sem lookup de atributo a cada linha)
+        fake_methods = {
+            "full_name": _FAKE.name,
+            "first_name": _FAKE.first_name,
+            "last_name": _FAKE.last_name,
+            "email": _FAKE.free_email,
+            "company": _FAKE.company,
+            "job": _FAKE.job,
+            "city": _FAKE.city,
+            "url": _FAKE.url,
+        }
+        if col_type_code in fake_methods:
+            return fake_methods[col_type_code]
+        if col_type_code == "address":
+            address = _FAKE.address
+            return lambda: address().replace("\n", ", ")
+        if col_type_code == "state" and hasattr(_FAKE, "estado_sigla"):
+            return _FAKE.estado_sigla
     if col_type_code == "address":
-        return lambda: rand_address()
-    if col_type_code == "city":
-        return lambda: rand_city()
+        return rand_address
+    if col_type_code == "url":
+        return rand_url
     if col_type_code == "state":
-        return lambda: rand_state()
+        return rand_state
+    return None
+
+def build_batch_generator(col_type_code: str, cfg: dict):
+    # Retorna uma função f(n) que gera uma lista com n valores (strings) da coluna
+    if col_type_code == "cpf":
+        return lambda n: batch_cpf(n, formatado=True)
+    if col_type_code == "phone":
+        return batch_phone
     if col_type_code == "cep":
-        return lambda: rand_cep(formatado=True)
-    if col_type_code == "date":
-        ys, ye = cfg.get("year_start", 2015), cfg.get("year_end", datetime.now().year)
-        return lambda: rand_date(ys, ye)
-    if col_type_code == "datetime":
-        ys, ye = cfg.get("year_start", 2015), cfg.get("year_end", datetime.now().year)
-        return lambda: rand_datetime(ys, ye)
+        return lambda n: batch_cep(n, formatado=True)
     if col_type_code == "int":
         mn, mx = cfg.get("min", 0), cfg.get("max", 100)
-        return lambda: str(rand_int(mn, mx))
+        table = _tabela(("int", mn, mx), mx - mn + 1, lambda: [str(v) for v in range(mn, mx + 1)])
+        if table is not None:
+            return lambda n: random.choices(table, k=n)
+        return lambda n: batch_int(n, mn, mx)
+    if col_type_code in ("date", "datetime"):
+        ys, ye = cfg.get("year_start", 2015), cfg.get("year_end", _CURRENT_YEAR)
+        inicio = date(ys, 1, 1).toordinal()
+        dias = date(ye, 12, 31).toordinal() - inicio + 1
+        days = _tabela(("date", ys, ye), dias, lambda: [date.fromordinal(inicio + d).strftime("%Y-%m-%d") for d in range(dias)])
+        if days is not None:
+            batch_days = lambda n: random.choices(days, k=n)
+        else:
+            batch_days = lambda n: [date.fromordinal(inicio + d).strftime("%Y-%m-%d") for d in random.choices(range(dias), k=n)]
+        if col_type_code == "date":
+            return batch_days
+        # dia, "HH:MM:" e segundos sorteados à parte: continua uniforme em todo o intervalo
+        hm = _tabela(("hh:mm",), 1440, lambda: [f" {h:02d}:{m:02d}:" for h in range(24) for m in range(60)])
+        ss = _tabela(("ss",), 60, lambda: [f"{s:02d}" for s in range(60)])
+        if hm is not None and ss is not None:
+            return lambda n: list(map("".join, zip(batch_days(n), random.choices(hm, k=n), random.choices(ss, k=n))))
+        return lambda n: [f"{d} {t // 3600:02d}:{t // 60 % 60:02d}:{t % 60:02d}"
+                          for d, t in zip(batch_days(n), random.choices(range(86400), k=n))]
     if col_type_code == "float":
         mn, mx, dec = cfg.get("min", 0.0), cfg.get("max", 100.0), cfg.get("decimals", 2)
-        return lambda: f"{rand_float(mn, mx, dec):.{dec}f}"
+        return lambda n: batch_float(n, mn, mx, dec)
     if col_type_code == "bool":
-        return lambda: "true" if rand_bool() else "false"
-    if col_type_code == "uuid":
-        return lambda: rand_uuid()
-    if col_type_code == "company":
-        return lambda: rand_company()
-    if col_type_code == "job":
-        return lambda: rand_job()
-    if col_type_code == "url":
-        return lambda: rand_url()
+        return batch_bool
+    if col_type_code == "price":
+        mn, mx, dec = cfg.get("min", 10.0), cfg.get("max", 1000.0), cfg.get("decimals", 2)
+        return lambda n: batch_float(n, mn, mx, dec)
     if col_type_code == "sentence":
-        return lambda: rand_sentence()
+        return batch_sentence
+    if col_type_code == "uuid":
+        return batch_uuid
+    # Categóricos: um único random.choices sorteia o lote inteiro
     if col_type_code == "picklist":
         options = cfg.get("options", ["A", "B", "C"])
-        return lambda: random.choice(options)
-    if col_type_code == "price":
-        mn, mx, dec = cfg.get("min", 10.0), cfg.get("max", 1000.0), cfg.get("decimals", 2)
-        return lambda: f"{rand_float(mn, mx, dec):.{dec}f}"
-    # fallback: UUID
-    return lambda: rand_uuid()
+        return lambda n: random.choices(options, k=n)
+    if not _FAKE:
+        if col_type_code in CATEGORY_POOLS:
+            pool = CATEGORY_POOLS[col_type_code]
+            return lambda n: random.choices(pool, k=n)
+        if col_type_code == "full_name":
+            return lambda n: list(map(" ".join, zip(random.choices(FIRST_NAMES, k=n), random.choices(LAST_NAMES, k=n))))
+        if col_type_code == "email":
+            fns = [x.lower() for x in FIRST_NAMES]
+            lns = [x.lower() for x in LAST_NAMES]
+            return lambda n: [f"{fn}.{ln}@{dom}" for fn, ln, dom in zip(
+                random.choices(fns, k=n), random.choices(lns, k=n), random.choices(DOMAINS, k=n))]
+    # demais tipos: chama o gerador de valor único n vezes
+    gen = _value_generator(col_type_code)
+    if gen is None:
+        # fallback: UUID
+        return batch_uuid
+    return lambda n: [gen() for _ in range(n)]
+
+# ------------------------- Escrita do CSV ----------------------
+
+# Cada lote sai numa única chamada de write_all (os.writev, com o terminador final à parte)
+CHUNK_ROWS = 4096          # linhas do 1º lote; a média dele dimensiona os seguintes por CHUNK_BYTES
+CHUNK_BYTES = 1 << 20      # tamanho alvo dos lotes seguintes (~1 MiB de CSV)
+MIN_CHUNK_ROWS, MAX_CHUNK_ROWS = 256, 16384
+PARALLEL_MIN_ROWS = 200_000  # abaixo disso, subir os processos não compensa
+LINE_END = "\r\n"          # mesmo terminador de linha que o csv.writer usava
+LINE_END_BYTES = LINE_END.encode("ascii")
+
+# Tipos cuja saída nunca contém vírgula, aspas ou quebra de linha (dispensam aspas)
+SAFE_CODES = {"int", "float", "uuid", "bool", "cpf", "cep", "date", "datetime", "phone", "price", "state", "sentence"}
+# Tipos que sempre contêm vírgula: aspas em todo valor, sem checar o lote antes
+ALWAYS_QUOTED_CODES = {"address"}
+
+def needs_quotes(text: str) -> bool:
+    return '"' in text or "," in text or "\n" in text or "\r" in text
+
+def csv_field(value: str) -> str:
+    # Mesma regra do csv.QUOTE_MINIMAL: aspas só quando o valor exige
+    if '"' in value:
+        return '"' + value.replace('"', '""') + '"'
+    if "," in value or "\n" in value or "\r" in value:
+        return f'"{value}"'
+    return value
+
+def column_is_safe(code: str, cfg: dict) -> bool:
+    # Além de SAFE_CODES, colunas sorteadas de listas fixas são seguras se nenhum item precisa de aspas
+    if code in SAFE_CODES:
+        return True
+    if code == "picklist":
+        return not needs_quotes("".join(cfg.get("options", ["A", "B", "C"])))
+    if not _FAKE:
+        if code in CATEGORY_POOLS:
+            return not needs_quotes("".join(CATEGORY_POOLS[code]))
+        if code in ("full_name", "email"):
+            return not needs_quotes("".join(FIRST_NAMES + LAST_NAMES + DOMAINS))
+        return code == "url"
+    return False
+
+def quoted(batch_gen):
+    # Checa o lote inteiro de uma vez (buscas em C); csv_field por valor só se algum precisar
+    def gen(n):
+        values = batch_gen(n)
+        if needs_quotes("".join(values)):
+            return list(map(csv_field, values))
+        return values
+    return gen
+
+def always_quoted(batch_gen):
+    return lambda n: list(map(csv_field, batch_gen(n)))
+
+def csv_header(columns: list) -> str:
+    return ",".join(csv_field(h) for (h, _, _) in columns)
+
+def prepare_columns(columns: list) -> tuple:
+    # Feito uma vez, fora do laço: a tupla de geradores de lote de cada coluna.
+    # Colunas seguras saem como estão; as demais ganham a checagem de aspas.
+    gens = []
+    for (_, code, cfg) in columns:
+        gen = build_batch_generator(code, cfg)
+        if code in ALWAYS_QUOTED_CODES:
+            gen = always_quoted(gen)
+        elif not column_is_safe(code, cfg):
+            gen = quoted(gen)
+        gens.append(gen)
+    return tuple(gens)
+
+def render_chunk(gens: tuple, n: int) -> bytes:
+    # Cada coluna gera seus n valores e zip() monta as linhas (sem o terminador final).
+    # str.join sobre a tupla do zip é mais rápido que montar a linha com f-string gerada via exec.
+    return LINE_END.join(map(",".join, zip(*[g(n) for g in gens]))).encode("utf-8")
+
+def usable_cpus() -> int:
+    # Em containers/afinidade restrita, cpu_count() superestima os núcleos disponíveis
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+# Geradores do processo atual (o principal ou um worker do Pool)
+_CHUNK_GENS: tuple = ()
+
+def init_chunk_worker(columns: list) -> None:
+    # As colunas vão como (header, código, cfg): closures não passam entre processos
+    global _CHUNK_GENS
+    _CHUNK_GENS = prepare_columns(columns)
+
+def generate_chunk(task: tuple[int, int]) -> bytes:
+    # Cada lote tem semente própria, então o resultado não depende de qual processo o gerou
+    seed, n = task
+    random.seed(seed)
+    if _FAKE:
+        _FAKE.seed_instance(seed)
+    return render_chunk(_CHUNK_GENS, n)
+
+def open_output(path: str) -> int:
+    # Arquivo aberto em modo binário (O_BINARY no Windows evita a troca de \n por \r\n)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    return os.open(path, flags, 0o644)
+
+def write_all(fd: int, *parts: bytes) -> None:
+    # Os pedaços vão ao kernel numa única chamada (os.writev), sem concatená-los antes.
+    # Sem writev (Windows) ou em escrita parcial, o restante segue por os.write.
+    if hasattr(os, "writev"):
+        written = os.writev(fd, parts)
+        if written == sum(map(len, parts)):
+            return
+        data = b"".join(parts)[written:]
+    else:
+        data = b"".join(parts)
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
 
 def main():
     print("=== GERADOR DE CSV — Dados Aleatórios (pt-BR) ===")
@@ -377,7 +544,7 @@ def main():
             _FAKE.seed_instance(seed)
 
     num_cols = prompt_int("\nQuantas colunas terá o CSV?", min_val=1, max_val=200, default=5)
-    columns = []  # lista de (header, generator)
+    columns = []  # lista de (header, código do tipo, cfg)
 
     for i in range(1, num_cols + 1):
         print(f"\n— Configuração da coluna {i}/{num_cols}")
@@ -391,22 +558,42 @@ def main():
             print("  > Este tipo possui configurações:")
             cfg = get_column_config(col_type.code)
 
-        gen_fn = build_generator(col_type.code, cfg)
-        columns.append((col_name, gen_fn))
+        columns.append((col_name, col_type.code, cfg))
 
     num_rows = prompt_int("\nQuantas LINHAS deseja gerar?", min_val=1, max_val=10_000_000, default=1000)
     default_filename = "dados_aleatorios.csv"
     out_name = prompt_str("Nome do arquivo CSV de saída", default=default_filename)
 
-    # Geração do CSV
-    created = 0
-    with open(out_name, "w", encoding="utf-8", newline="") as f:
-        writer = csv.writer(f, delimiter=",")
-        writer.writerow([h for (h, _) in columns])
-        for _ in range(num_rows):
-            row = [gen() for (_, gen) in columns]
-            writer.writerow(row)
-            created += 1
+    # Geração do CSV em lotes, montando as linhas direto como texto.
+    # As sementes dos lotes saem do random principal (fixado acima, se o usuário quis),
+    # então a saída é a mesma gerando em um ou em vários processos.
+    init_chunk_worker(columns)
+    fd = open_output(out_name)
+    try:
+        write_all(fd, csv_header(columns).encode("utf-8"), LINE_END_BYTES)
+        created = min(CHUNK_ROWS, num_rows)
+        data = generate_chunk((random.getrandbits(64), created))
+        write_all(fd, data, LINE_END_BYTES)
+        # O tamanho médio das linhas do 1º lote define os lotes seguintes (~CHUNK_BYTES cada)
+        chunk_rows = min(MAX_CHUNK_ROWS, max(MIN_CHUNK_ROWS, CHUNK_BYTES * created // (len(data) + len(LINE_END_BYTES))))
+        tasks = [(random.getrandbits(64), min(chunk_rows, num_rows - start))
+                 for start in range(created, num_rows, chunk_rows)]
+        workers = usable_cpus()
+        if num_rows >= PARALLEL_MIN_ROWS and workers > 1:
+            # Com fork, os workers herdam _CHUNK_GENS já montado; só spawn/forkserver remontam
+            if multiprocessing.get_start_method() == "fork":
+                pool = multiprocessing.Pool(workers)
+            else:
+                pool = multiprocessing.Pool(workers, initializer=init_chunk_worker, initargs=(columns,))
+            with pool:
+                for data in pool.imap(generate_chunk, tasks):
+                    write_all(fd, data, LINE_END_BYTES)
+        else:
+            for task in tasks:
+                write_all(fd, generate_chunk(task), LINE_END_BYTES)
+        created += sum(n for (_, n) in tasks)
+    finally:
+        os.close(fd)
 
     size_mb = os.path.getsize(out_name) / (1024 * 1024)
     print(f"\n✅ Arquivo '{out_name}' gerado com sucesso!")